@@ -2,18 +2,40 @@
 
 # VulkanMon Build and Run Script
 # Builds the project and runs the debug version
+# Usage: ./build_and_run.sh [--clean]
+#   --clean  Wipe build/ and compiled shaders before building (old default behavior)
 
 set -e  # Exit on any error
 
 echo "=== VulkanMon Build and Run ==="
 
-# Clean and rebuild
-echo "Step 1: Cleaning previous build..."
-rm -rf build
-rm -f shaders/*.spv
-
-echo "Step 2: Configuring project..."
-cmake --preset dev-windows
+if [ "$1" == "--clean" ]; then
+    echo "Step 1: Cleaning previous build..."
+    rm -rf build
+    rm -f shaders/*.spv
+else
+    echo "Step 1: Keeping previous build (pass --clean for a full rebuild)"
+fi
+
+# Only configure when there is no cache yet or the CMake inputs changed since it was written;
+# otherwise the incremental build below reuses the existing configuration
+CONFIGURE_NEEDED=0
+if [ ! -f build/CMakeCache.txt ]; then
+    CONFIGURE_NEEDED=1
+else
+    for input in CMakeLists.txt CMakePresets.json tests_cpp/CMakeLists.txt vcpkg.json; do
+        if [ -f "$input" ] && [ "$input" -nt build/CMakeCache.txt ]; then
+            CONFIGURE_NEEDED=1
+        fi
+    done
+fi
+
+if [ "$CONFIGURE_NEEDED" -eq 1 ]; then
+    echo "Step 2: Configuring project..."
+    cmake --preset dev-windows
+else
+    echo "Step 2: Configuration up to date, skipping configure"
+fi
 
 echo "Step 3: Building project..."
 cmake --build build --config Debug --parallel
@@ -21,4 +43,4 @@ cmake --build build --config Debug --parallel
 echo "Step 4: Running application..."
 ./build/Debug/vulkanmon.exe
 
-echo "Build and run completed!"
\ No newline at end of file
+echo "Build and run completed!"
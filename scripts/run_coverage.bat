@@ -7,12 +7,12 @@ echo VulkanMon Test Coverage Runner
 echo ========================================
 
 REM Create coverage build directory
+REM Paths are passed explicitly so the caller's working directory is left untouched
 if not exist build_coverage mkdir build_coverage
-cd build_coverage
 
 echo.
 echo [1/4] Configuring with coverage enabled...
-cmake .. -DENABLE_COVERAGE=ON
+cmake -S . -B build_coverage -DENABLE_COVERAGE=ON
 if errorlevel 1 (
     echo ERROR: CMake configuration failed
     exit /b 1
@@ -20,7 +20,7 @@ if errorlevel 1 (
 
 echo.
 echo [2/4] Building tests with coverage...
-cmake --build . --config Debug
+cmake --build build_coverage --config Debug --parallel
 if errorlevel 1 (
     echo ERROR: Build failed
     exit /b 1
@@ -28,9 +28,11 @@ if errorlevel 1 (
 
 echo.
 echo [3/4] Running tests to generate coverage data...
-cd tests_cpp
+pushd build_coverage\tests_cpp
 Debug\vulkanmon_tests.exe
-if errorlevel 1 (
+set TEST_RESULT=%errorlevel%
+popd
+if not "%TEST_RESULT%"=="0" (
     echo ERROR: Tests failed
     exit /b 1
 )
@@ -48,5 +50,3 @@ echo.
 echo ========================================
 echo Coverage run completed successfully!
 echo ========================================
-
-cd ..\..
\ No newline at end of file
@@ -7,12 +7,17 @@ echo "VulkanMon Test Coverage Runner"
 echo "========================================"
 
 # Create coverage build directory
+# Paths are passed explicitly so the caller's working directory is left untouched
 mkdir -p build_coverage
-cd build_coverage
 
 echo
 echo "[1/4] Configuring with coverage enabled..."
-cmake .. -DENABLE_COVERAGE=ON
+# Prefer Ninja for a fresh coverage tree; an existing cache keeps its generator
+COVERAGE_GENERATOR_ARGS=""
+if [ ! -f build_coverage/CMakeCache.txt ] && command -v ninja >/dev/null 2>&1; then
+    COVERAGE_GENERATOR_ARGS="-G Ninja -DCMAKE_BUILD_TYPE=Debug"
+fi
+cmake -S . -B build_coverage $COVERAGE_GENERATOR_ARGS -DENABLE_COVERAGE=ON
 if [ $? -ne 0 ]; then
     echo "ERROR: CMake configuration failed"
     exit 1
@@ -20,7 +25,7 @@ fi
 
 echo
 echo "[2/4] Building tests with coverage..."
-cmake --build . --config Debug
+cmake --build build_coverage --config Debug --parallel
 if [ $? -ne 0 ]; then
     echo "ERROR: Build failed"
     exit 1
@@ -28,8 +33,20 @@ fi
 
 echo
 echo "[3/4] Running tests to generate coverage data..."
-cd tests_cpp
-./Debug/vulkanmon_tests || Debug/vulkanmon_tests.exe
+# Single-config generators (Ninja) put the binary directly in tests_cpp/,
+# multi-config ones (Visual Studio) in tests_cpp/Debug/
+COVERAGE_TEST_DIR=build_coverage/tests_cpp
+if [ ! -x "$COVERAGE_TEST_DIR/vulkanmon_tests" ]; then
+    COVERAGE_TEST_DIR="$COVERAGE_TEST_DIR/Debug"
+fi
+(
+    cd "$COVERAGE_TEST_DIR"
+    if [ -x ./vulkanmon_tests ]; then
+        ./vulkanmon_tests
+    else
+        ./vulkanmon_tests.exe
+    fi
+)
 if [ $? -ne 0 ]; then
     echo "ERROR: Tests failed"
     exit 1
@@ -38,7 +55,7 @@ fi
 echo
 echo "[4/4] Coverage data generated successfully!"
 echo
-echo "Coverage files created in: build_coverage/tests_cpp/Debug/"
+echo "Coverage files created in: $COVERAGE_TEST_DIR/"
 echo "- Look for coverage data files"
 echo
 echo "Next steps:"
@@ -48,5 +65,3 @@ echo
 echo "========================================"
 echo "Coverage run completed successfully!"
 echo "========================================"
-
-cd ../..
\ No newline at end of file
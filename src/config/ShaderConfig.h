@@ -0,0 +1,41 @@
+#pragma once
+
+namespace VulkanMon::Config {
+    /**
+     * Shader file locations - Single source of truth
+     * Used by: VulkanRenderer (pipeline creation), Utils (hot reload)
+     *
+     * This replaces path strings previously built inline in:
+     * - VulkanRenderer.cpp (*_SHADER_COMPILED constants)
+     * - Utils.cpp (hot reload source and SPIR-V output paths)
+     */
+    struct Shaders {
+        // =================================================================
+        // Compiled SPIR-V (resolved through Utils::readFile search paths)
+        // =================================================================
+
+        /// Main pipeline vertex shader
+        static constexpr const char* VERTEX_COMPILED = "shaders/vert.spv";
+
+        /// Main pipeline fragment shader
+        static constexpr const char* FRAGMENT_COMPILED = "shaders/frag.spv";
+
+        /// Instanced creature pipeline vertex shader
+        static constexpr const char* INSTANCED_VERTEX_COMPILED = "shaders/instanced_vert.spv";
+
+        /// Instanced creature pipeline fragment shader
+        static constexpr const char* INSTANCED_FRAGMENT_COMPILED = "shaders/instanced_frag.spv";
+
+        // =================================================================
+        // Hot Reload (relative to build/, where the executable runs)
+        // =================================================================
+
+        /// GLSL source recompiled by the R key
+        static constexpr const char* HOT_RELOAD_VERTEX_SOURCE = "../shaders/triangle.vert";
+        static constexpr const char* HOT_RELOAD_FRAGMENT_SOURCE = "../shaders/triangle.frag";
+
+        /// SPIR-V written by hot reload (same files as *_COMPILED above)
+        static constexpr const char* HOT_RELOAD_VERTEX_OUTPUT = "../shaders/vert.spv";
+        static constexpr const char* HOT_RELOAD_FRAGMENT_OUTPUT = "../shaders/frag.spv";
+    };
+}
@@ -86,6 +86,10 @@ void Application::run() {
         VKMON_INFO("About to enter main loop - checking window shouldClose()...");
         while (running_ && !window_->shouldClose()) {
             processFrame();
+
+            // INFO/DEBUG lines are buffered during the main loop; write each frame's
+            // out so a crash in a later frame still leaves everything leading up to it
+            Logger::getInstance().flush();
         }
     } catch (const std::exception& e) {
         handleCriticalError(e);
@@ -1,6 +1,7 @@
 #include "AssetManager.h"
 #include "../utils/Logger.h"
 #include "../rendering/ResourceManager.h"
+#include "../rendering/SingleTimeCommands.h"
 #include <fstream>
 #include <filesystem>
 #include <chrono>
@@ -47,10 +48,11 @@ void AssetManager::initializeAssetDirectories() {
     assetSubdirectories_[AssetType::SCENE] = "scenes/";
     assetSubdirectories_[AssetType::AUDIO] = "audio/";
     
-    // Verify directories exist
+    // Verify directories exist; is_directory() reports missing paths through ec instead of throwing
     for (const auto& [type, subdir] : assetSubdirectories_) {
         std::string fullPath = assetsRootPath_ + subdir;
-        if (!std::filesystem::exists(fullPath)) {
+        std::error_code ec;
+        if (!std::filesystem::is_directory(fullPath, ec)) {
             VKMON_WARNING("Asset directory does not exist: " + fullPath);
         } else {
             VKMON_DEBUG("Asset directory verified: " + fullPath);
@@ -73,7 +75,9 @@ bool AssetManager::validateAssetPath(const std::string& relativePath) const {
 }
 
 bool AssetManager::fileExists(const std::string& path) const {
-    return std::filesystem::exists(path) && std::filesystem::is_regular_file(path);
+    // is_regular_file() is false for missing paths, so one status() call covers both checks
+    std::error_code ec;
+    return std::filesystem::is_regular_file(path, ec);
 }
 
 std::string AssetManager::getFileExtension(const std::string& filename) const {
@@ -270,13 +274,9 @@ VkCommandBuffer AssetManager::beginSingleTimeCommands() {
 void AssetManager::endSingleTimeCommands(VkCommandBuffer commandBuffer) {
     vkEndCommandBuffer(commandBuffer);
 
-    VkSubmitInfo submitInfo{};
-    submitInfo.sType = VK_STRUCTURE_TYPE_SUBMIT_INFO;
-    submitInfo.commandBufferCount = 1;
-    submitInfo.pCommandBuffers = &commandBuffer;
-
-    vkQueueSubmit(graphicsQueue_, 1, &submitInfo, VK_NULL_HANDLE);
-    vkQueueWaitIdle(graphicsQueue_);
+    if (!submitSingleTimeCommands(device_, graphicsQueue_, commandBuffer)) {
+        throw std::runtime_error("Failed to execute single-time command buffer");
+    }
 
     vkFreeCommandBuffers(device_, commandPool_, 1, &commandBuffer);
 }
@@ -22,10 +22,50 @@
 #include <iostream>
 #include <exception>
 #include <cstdlib>
+#include <filesystem>
+#include <fstream>
+#include <string>
 
 using namespace VulkanMon;
 
-int main() {
+/*
+ * Command line options:
+ *   --smoke             Initialize every engine system, then exit cleanly without
+ *                       entering the main loop. Lets scripts and CI verify startup
+ *                       with a plain process launch instead of running the window
+ *                       and killing it.
+ *   --ready-file <path> Create <path> once initialization has finished, just before
+ *                       the main loop starts. Scripts can wait for the file to appear
+ *                       instead of sleeping and scraping console output.
+ */
+int main(int argc, char** argv) {
+    constexpr const char* USAGE = "Usage: vulkanmon [--smoke] [--ready-file <path>]\n";
+    bool smokeTest = false;
+    std::string readyFile;
+    for (int i = 1; i < argc; ++i) {
+        std::string arg = argv[i];
+        if (arg == "--smoke") {
+            smokeTest = true;
+        } else if (arg == "--ready-file") {
+            if (i + 1 >= argc) {
+                std::cerr << "--ready-file requires a path\n";
+                std::cerr << USAGE;
+                return EXIT_FAILURE;
+            }
+            readyFile = argv[++i];
+        } else {
+            std::cerr << "Unknown option: " << arg << "\n";
+            std::cerr << USAGE;
+            return EXIT_FAILURE;
+        }
+    }
+
+    // A marker left over from an earlier run would signal readiness too early
+    if (!readyFile.empty()) {
+        std::error_code ec;
+        std::filesystem::remove(readyFile, ec);
+    }
+
     // Initialize logging for startup
     Logger::getInstance().enableConsoleOutput(true);
     Logger::getInstance().setLogLevel(LogLevel::INFO_LEVEL);
@@ -37,8 +77,27 @@ int main() {
         // Initialize all engine systems
         app.initialize();
 
+        if (!readyFile.empty()) {
+            std::ofstream marker(readyFile, std::ios::binary | std::ios::trunc);
+            marker << "ready\n";
+            // Close first: a write error may only surface when the buffer is flushed
+            marker.close();
+            if (!marker) {
+                VKMON_WARNING("Failed to write ready file: " + readyFile);
+            }
+        }
+
+        if (smokeTest) {
+            VKMON_INFO("Smoke test: initialization complete, exiting before main loop");
+            return EXIT_SUCCESS;
+        }
+
         VKMON_INFO("VulkanMon ready! Starting main loop...");
 
+        // Startup logged line by line so a crash in initialize() keeps every step;
+        // from here on INFO lines are written out once per frame
+        Logger::getInstance().enableBufferedOutput(true);
+
         // Run main application loop
         app.run();
         
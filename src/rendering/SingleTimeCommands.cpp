@@ -0,0 +1,50 @@
+#include "SingleTimeCommands.h"
+#include "../utils/Logger.h"
+
+#include <string>
+
+namespace VulkanMon {
+
+bool submitSingleTimeCommands(VkDevice device, VkQueue queue, VkCommandBuffer commandBuffer) {
+    VkSubmitInfo submitInfo{};
+    submitInfo.sType = VK_STRUCTURE_TYPE_SUBMIT_INFO;
+    submitInfo.commandBufferCount = 1;
+    submitInfo.pCommandBuffers = &commandBuffer;
+
+    VkFenceCreateInfo fenceInfo{};
+    fenceInfo.sType = VK_STRUCTURE_TYPE_FENCE_CREATE_INFO;
+
+    VkFence fence = VK_NULL_HANDLE;
+    if (vkCreateFence(device, &fenceInfo, nullptr, &fence) != VK_SUCCESS) {
+        VKMON_WARNING("Failed to create single-time command fence, falling back to queue idle wait");
+        if (vkQueueSubmit(queue, 1, &submitInfo, VK_NULL_HANDLE) != VK_SUCCESS) {
+            VKMON_ERROR("Failed to submit single-time command buffer");
+            return false;
+        }
+        VkResult waitResult = vkQueueWaitIdle(queue);
+        if (waitResult != VK_SUCCESS) {
+            VKMON_ERROR("vkQueueWaitIdle failed for single-time command buffer (VkResult " +
+                        std::to_string(waitResult) + ")");
+            return false;
+        }
+        return true;
+    }
+
+    bool completed = false;
+    if (vkQueueSubmit(queue, 1, &submitInfo, fence) != VK_SUCCESS) {
+        VKMON_ERROR("Failed to submit single-time command buffer");
+    } else {
+        VkResult waitResult = vkWaitForFences(device, 1, &fence, VK_TRUE, UINT64_MAX);
+        if (waitResult == VK_SUCCESS) {
+            completed = true;
+        } else {
+            VKMON_ERROR("vkWaitForFences failed for single-time command buffer (VkResult " +
+                        std::to_string(waitResult) + ")");
+        }
+    }
+
+    vkDestroyFence(device, fence, nullptr);
+    return completed;
+}
+
+} // namespace VulkanMon
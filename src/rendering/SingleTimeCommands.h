@@ -0,0 +1,25 @@
+#pragma once
+
+#include <vulkan/vulkan.h>
+
+namespace VulkanMon {
+
+/**
+ * Submit a recorded one-shot command buffer and block until it has executed
+ *
+ * Waits on a fence for this submission only; vkQueueWaitIdle would also block
+ * on unrelated work (e.g. in-flight frames) sharing the queue. Falls back to
+ * vkQueueWaitIdle if the fence cannot be created. A failed submit is logged
+ * and not waited on, since its fence would never be signaled.
+ *
+ * The caller still owns the command buffer. It may only be freed when this
+ * returns true; on false it may still be pending on the queue.
+ *
+ * @param device Logical device that owns the queue
+ * @param queue Queue to submit to
+ * @param commandBuffer Command buffer that has already been ended
+ * @return true if the work was submitted and has completed
+ */
+[[nodiscard]] bool submitSingleTimeCommands(VkDevice device, VkQueue queue, VkCommandBuffer commandBuffer);
+
+} // namespace VulkanMon
@@ -1,9 +1,11 @@
 #include "VulkanRenderer.h"
 #include "../utils/Utils.h"
+#include "SingleTimeCommands.h"
 #include "../io/ModelLoader.h"
 #include "../systems/MaterialSystem.h"
 #include "../utils/Logger.h"
 #include "../config/CameraConfig.h"
+#include "../config/ShaderConfig.h"
 #include <iostream>
 #include <stdexcept>
 #include <array>
@@ -16,12 +18,6 @@
 
 using namespace VulkanMon;
 
-// Shader file constants
-constexpr const char* VERTEX_SHADER_COMPILED = "shaders/vert.spv";
-constexpr const char* FRAGMENT_SHADER_COMPILED = "shaders/frag.spv";
-constexpr const char* INSTANCED_VERTEX_SHADER_COMPILED = "shaders/instanced_vert.spv";
-constexpr const char* INSTANCED_FRAGMENT_SHADER_COMPILED = "shaders/instanced_frag.spv";
-
 VulkanRenderer::VulkanRenderer(
     std::shared_ptr<Window> window,
     std::shared_ptr<ResourceManager> resourceManager,
@@ -106,10 +102,7 @@ void VulkanRenderer::handleWindowResize(int width, int height) {
         return;
     }
 
-    // Wait for device to be idle before recreating swapchain
-    vkDeviceWaitIdle(device_);
-
-    // Recreate swapchain with new dimensions
+    // Recreate swapchain with new dimensions (recreateSwapChain waits for the device itself)
     recreateSwapChain();
 
     // Update ImGui display size
@@ -129,9 +122,16 @@ void VulkanRenderer::reloadShaders() {
     
     try {
         // 1. Recompile shader files
-        if (!Utils::recompileShaders()) {
+        Utils::ShaderRecompileResult result = Utils::recompileShaders();
+        if (result == Utils::ShaderRecompileResult::Failed) {
             throw std::runtime_error("Shader recompilation failed");
         }
+        if (result == Utils::ShaderRecompileResult::UpToDate && !shaderFilesChangedSinceLoad()) {
+            // Nothing compiled now or since the modules were loaded (e.g. by a CMake
+            // build), so the current pipeline still matches the SPIR-V on disk
+            VKMON_INFO("Shaders unchanged, keeping current pipeline");
+            return;
+        }
         
         // 2. Wait for device to be idle
         vkDeviceWaitIdle(device_);
@@ -691,22 +691,12 @@ bool VulkanRenderer::performGPUWarmup() {
         vkCmdEndRenderPass(warmupCommandBuffer);
         vkEndCommandBuffer(warmupCommandBuffer);
 
-        // Submit the command buffer and wait for completion
-        VkSubmitInfo submitInfo{};
-        submitInfo.sType = VK_STRUCTURE_TYPE_SUBMIT_INFO;
-        submitInfo.commandBufferCount = 1;
-        submitInfo.pCommandBuffers = &warmupCommandBuffer;
-
-        if (vkQueueSubmit(graphicsQueue_, 1, &submitInfo, VK_NULL_HANDLE) != VK_SUCCESS) {
-            VKMON_ERROR("Failed to submit GPU warm-up command buffer");
-            vkFreeCommandBuffers(device_, commandPool_, 1, &warmupCommandBuffer);
+        // Submit the command buffer and wait on a fence for just this submission
+        if (!submitSingleTimeCommands(device_, graphicsQueue_, warmupCommandBuffer)) {
+            VKMON_ERROR("GPU warm-up command buffer did not complete");
             return false;
         }
 
-        // Wait for the GPU warm-up to complete
-        vkQueueWaitIdle(graphicsQueue_);
-
-        // Clean up the command buffer
         vkFreeCommandBuffers(device_, commandPool_, 1, &warmupCommandBuffer);
 
         auto endTime = std::chrono::high_resolution_clock::now();
@@ -1058,8 +1048,14 @@ void VulkanRenderer::createRenderPass() {
 void VulkanRenderer::createShaderModules() {
     VKMON_DEBUG("Creating shader modules...");
     
-    auto vertShaderCode = Utils::readFile(VERTEX_SHADER_COMPILED);
-    auto fragShaderCode = Utils::readFile(FRAGMENT_SHADER_COMPILED);
+    // Stamp before reading: a write racing the read then shows up as a change on the next reload
+    vertShaderStamp_ = {};
+    fragShaderStamp_ = {};
+    Utils::getFileStamp(Config::Shaders::VERTEX_COMPILED, vertShaderStamp_);
+    Utils::getFileStamp(Config::Shaders::FRAGMENT_COMPILED, fragShaderStamp_);
+
+    auto vertShaderCode = Utils::readFile(Config::Shaders::VERTEX_COMPILED);
+    auto fragShaderCode = Utils::readFile(Config::Shaders::FRAGMENT_COMPILED);
 
     vertShaderModule_ = createShaderModule(vertShaderCode);
     fragShaderModule_ = createShaderModule(fragShaderCode);
@@ -1067,6 +1063,16 @@ void VulkanRenderer::createShaderModules() {
     VKMON_INFO("Shaders loaded successfully");
 }
 
+bool VulkanRenderer::shaderFilesChangedSinceLoad() const {
+    Utils::FileStamp vertStamp;
+    Utils::FileStamp fragStamp;
+    if (!Utils::getFileStamp(Config::Shaders::VERTEX_COMPILED, vertStamp) ||
+        !Utils::getFileStamp(Config::Shaders::FRAGMENT_COMPILED, fragStamp)) {
+        return true;
+    }
+    return vertStamp != vertShaderStamp_ || fragStamp != fragShaderStamp_;
+}
+
 VkShaderModule VulkanRenderer::createShaderModule(const std::vector<char>& code) {
     VkShaderModuleCreateInfo createInfo{};
     createInfo.sType = VK_STRUCTURE_TYPE_SHADER_MODULE_CREATE_INFO;
@@ -1220,8 +1226,8 @@ void VulkanRenderer::createInstancedShaderModules() {
     VKMON_DEBUG("Creating instanced shader modules...");
 
     // Load compiled instanced shaders
-    auto instancedVertShaderCode = Utils::readFile(INSTANCED_VERTEX_SHADER_COMPILED);
-    auto instancedFragShaderCode = Utils::readFile(INSTANCED_FRAGMENT_SHADER_COMPILED);
+    auto instancedVertShaderCode = Utils::readFile(Config::Shaders::INSTANCED_VERTEX_COMPILED);
+    auto instancedFragShaderCode = Utils::readFile(Config::Shaders::INSTANCED_FRAGMENT_COMPILED);
 
     instancedVertShaderModule_ = createShaderModule(instancedVertShaderCode);
     instancedFragShaderModule_ = createShaderModule(instancedFragShaderCode);
@@ -2236,20 +2242,23 @@ void VulkanRenderer::initializeCoreSystemsTemporary() {
         std::filesystem::path absolutePath = std::filesystem::absolute(path);
         VKMON_DEBUG("Checking assets path: " + absolutePath.string());
         
-        if (std::filesystem::exists(absolutePath) && std::filesystem::is_directory(absolutePath)) {
-            // Verify it contains expected subdirectories
-            if (std::filesystem::exists(absolutePath / "models")) {
-                assetsPath = absolutePath;
-                foundAssets = true;
-                VKMON_INFO("Found assets directory: " + assetsPath.string());
-                break;
-            }
+        // A models/ subdirectory implies the assets directory itself exists,
+        // so one non-throwing stat per candidate answers both questions
+        std::error_code ec;
+        if (std::filesystem::is_directory(absolutePath / "models", ec)) {
+            assetsPath = absolutePath;
+            foundAssets = true;
+            VKMON_INFO("Found assets directory: " + assetsPath.string());
+            break;
         }
     }
     
     if (!foundAssets) {
         VKMON_ERROR("Could not find assets directory in any expected location");
         VKMON_ERROR("Current executable path: " + executablePath.string());
+        for (const auto& path : possiblePaths) {
+            VKMON_ERROR("  Checked: " + std::filesystem::absolute(path).string());
+        }
         throw std::runtime_error("Assets directory not found - please ensure assets/ exists relative to executable");
     }
     
@@ -2893,13 +2902,9 @@ VkCommandBuffer VulkanRenderer::beginSingleTimeCommands() {
 void VulkanRenderer::endSingleTimeCommands(VkCommandBuffer commandBuffer) {
     vkEndCommandBuffer(commandBuffer);
 
-    VkSubmitInfo submitInfo{};
-    submitInfo.sType = VK_STRUCTURE_TYPE_SUBMIT_INFO;
-    submitInfo.commandBufferCount = 1;
-    submitInfo.pCommandBuffers = &commandBuffer;
-
-    vkQueueSubmit(graphicsQueue_, 1, &submitInfo, VK_NULL_HANDLE);
-    vkQueueWaitIdle(graphicsQueue_);
+    if (!submitSingleTimeCommands(device_, graphicsQueue_, commandBuffer)) {
+        throw std::runtime_error("Failed to execute single-time command buffer");
+    }
 
     vkFreeCommandBuffers(device_, commandPool_, 1, &commandBuffer);
 }
@@ -13,6 +13,7 @@
 #include "../systems/LightingSystem.h"
 #include "../systems/MaterialSystem.h"
 #include "../utils/Logger.h"
+#include "../utils/Utils.h"
 
 #include <memory>
 #include <vector>
@@ -433,6 +434,10 @@ private:
     VkRenderPass renderPass_ = VK_NULL_HANDLE;
     VkShaderModule vertShaderModule_ = VK_NULL_HANDLE;
     VkShaderModule fragShaderModule_ = VK_NULL_HANDLE;
+    // SPIR-V files as they were when the modules above were created; hot reload
+    // compares against these to catch .spv files rebuilt outside the app
+    Utils::FileStamp vertShaderStamp_;
+    Utils::FileStamp fragShaderStamp_;
     VkPipelineLayout pipelineLayout_ = VK_NULL_HANDLE;
     VkPipeline graphicsPipeline_ = VK_NULL_HANDLE;
 
@@ -519,6 +524,7 @@ private:
     void recreateSwapChain();
     void createRenderPass();
     void createShaderModules();
+    bool shaderFilesChangedSinceLoad() const;
     void createGraphicsPipeline();
     void createInstancedShaderModules();
     void createInstancedGraphicsPipeline();
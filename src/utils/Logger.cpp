@@ -70,7 +70,9 @@ void Logger::log(LogLevel level, const std::string& message) {
     
     oss << "[" << getLevelString(level) << "] " << message;
     
-    writeToOutputs(oss.str());
+    // Warnings and errors are always flushed right away so they survive a crash;
+    // in buffered mode DEBUG/INFO lines wait for the next flush() or exit
+    writeToOutputs(oss.str(), !bufferedOutput_ || level >= LogLevel::WARNING_LEVEL);
 }
 
 void Logger::debug(const std::string& message) {
@@ -133,7 +135,19 @@ void Logger::flush() {
     }
 }
 
-std::string Logger::getLevelString(LogLevel level) const {
+void Logger::startCapture() {
+    std::lock_guard<std::mutex> lock(logMutex_);
+    capturedLines_.clear();
+    capturing_ = true;
+}
+
+std::vector<std::string> Logger::stopCapture() {
+    std::lock_guard<std::mutex> lock(logMutex_);
+    capturing_ = false;
+    return std::move(capturedLines_);
+}
+
+const char* Logger::getLevelString(LogLevel level) const {
     switch (level) {
         case LogLevel::DEBUG_LEVEL:   return "DEBUG";
         case LogLevel::INFO_LEVEL:    return "INFO ";
@@ -156,15 +170,27 @@ std::string Logger::getCurrentTimestamp() const {
     return oss.str();
 }
 
-void Logger::writeToOutputs(const std::string& formattedMessage) {
+void Logger::writeToOutputs(const std::string& formattedMessage, bool flushNow) {
+    // '\n' instead of std::endl: a flush per line is a write syscall per line
     // Write to console
     if (consoleOutput_) {
-        std::cout << formattedMessage << std::endl;
+        std::cout << formattedMessage << '\n';
+        if (flushNow) {
+            std::cout.flush();
+        }
     }
     
     // Write to file
     if (fileStream_ && fileStream_->is_open()) {
-        *fileStream_ << formattedMessage << std::endl;
+        *fileStream_ << formattedMessage << '\n';
+        if (flushNow) {
+            fileStream_->flush();
+        }
+    }
+    
+    // Keep a copy for capture
+    if (capturing_) {
+        capturedLines_.push_back(formattedMessage);
     }
 }
 
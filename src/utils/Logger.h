@@ -6,6 +6,7 @@
 #include <chrono>
 #include <memory>
 #include <mutex>
+#include <vector>
 
 /**
  * VulkanMon Logging System
@@ -18,6 +19,7 @@
  * Features:
  * - Multiple log levels (Debug, Info, Warning, Error, Fatal)
  * - Console and file output
+ * - In-memory capture for tests
  * - Thread-safe logging
  * - Automatic timestamping
  * - Configurable output formatting
@@ -52,6 +54,9 @@ public:
     void disableFileOutput();
     void enableConsoleOutput(bool enable) { consoleOutput_ = enable; }
     void enableTimestamps(bool enable) { timestamps_ = enable; }
+    // Off by default: every line is flushed, so nothing is lost if startup crashes.
+    // When on, DEBUG/INFO lines wait for flush() (done once per frame by Application::run)
+    void enableBufferedOutput(bool enable) { bufferedOutput_ = enable; }
     
     // Core logging methods
     void log(LogLevel level, const std::string& message);
@@ -71,6 +76,11 @@ public:
     
     // Flush all outputs
     void flush();
+    
+    // In-memory capture - every formatted line is also kept until stopCapture()
+    // Lets tests assert on log output directly instead of scraping the console
+    void startCapture();
+    std::vector<std::string> stopCapture();
 
 private:
     Logger() = default;
@@ -83,19 +93,24 @@ private:
     Logger& operator=(Logger&&) = delete;
     
     // Helper methods
-    std::string getLevelString(LogLevel level) const;
+    const char* getLevelString(LogLevel level) const;
     std::string getCurrentTimestamp() const;
-    void writeToOutputs(const std::string& formattedMessage);
+    void writeToOutputs(const std::string& formattedMessage, bool flushNow);
     
     // Configuration
     LogLevel logLevel_ = LogLevel::INFO_LEVEL;
     bool consoleOutput_ = true;
     bool timestamps_ = true;
+    bool bufferedOutput_ = false;
     
     // File output
     std::unique_ptr<std::ofstream> fileStream_;
     std::string currentLogFile_;
     
+    // Capture output
+    bool capturing_ = false;
+    std::vector<std::string> capturedLines_;
+    
     // Thread safety
     std::mutex logMutex_;
 };
@@ -1,67 +1,301 @@
 #include "Utils.h"
+#include "../config/ShaderConfig.h"
 #include <fstream>
 #include <iostream>
 #include <stdexcept>
 #include <cstdlib>
+#include <unordered_map>
+#include <mutex>
+#include <filesystem>
+#include <future>
+#include <iterator>
 
-std::vector<char> Utils::readFile(const std::string& filename) {
-    // Try multiple common locations for shader files
-    std::vector<std::string> searchPaths = {
-        filename,                    // Direct path (current working directory)
-        "../" + filename,           // One level up (if running from build/)
-        "../../" + filename,        // Two levels up
-        "./" + filename             // Explicit current directory
+#include <glslang/Public/ShaderLang.h>
+#include <glslang/Public/ResourceLimits.h>
+#include <glslang/SPIRV/GlslangToSpv.h>
+
+namespace {
+    struct StageCompileResult {
+        bool success = false;
+        std::string log;   // glslang errors and warnings, printed once the stage is done
     };
-    
-    std::ifstream file;
-    std::string foundPath;
-    
-    for (const auto& path : searchPaths) {
-        file.open(path, std::ios::ate | std::ios::binary);
-        if (file.is_open()) {
-            foundPath = path;
-            break;
+
+    // glslang's process-wide tables are built once, on the first hot reload
+    void initializeShaderCompiler() {
+        static std::once_flag initialized;
+        std::call_once(initialized, [] {
+            glslang::InitializeProcess();
+            std::atexit([] { glslang::FinalizeProcess(); });
+        });
+    }
+
+    // Compiles GLSL to SPIR-V in-process with the settings `glslangValidator -V` uses
+    // (Vulkan 1.0 client, SPIR-V 1.0 target), so the output matches the CMake-built binaries.
+    // Each call owns its TShader/TProgram, so stages can compile on separate threads
+    StageCompileResult compileShaderStage(EShLanguage language, const std::string& source,
+                                          const char* sourcePath, const char* outputPath) {
+        StageCompileResult result;
+
+        const char* sourceText = source.c_str();
+        const int sourceLength = static_cast<int>(source.size());
+        glslang::TShader shader(language);
+        shader.setStringsWithLengthsAndNames(&sourceText, &sourceLength, &sourcePath, 1);
+        shader.setEnvInput(glslang::EShSourceGlsl, language, glslang::EShClientVulkan, 100);
+        shader.setEnvClient(glslang::EShClientVulkan, glslang::EShTargetVulkan_1_0);
+        shader.setEnvTarget(glslang::EShTargetSpv, glslang::EShTargetSpv_1_0);
+
+        const EShMessages messages = static_cast<EShMessages>(EShMsgSpvRules | EShMsgVulkanRules);
+        if (!shader.parse(GetDefaultResources(), 100, false, messages)) {
+            result.log = std::string(shader.getInfoLog()) + shader.getInfoDebugLog();
+            return result;
+        }
+
+        glslang::TProgram program;
+        program.addShader(&shader);
+        if (!program.link(messages)) {
+            result.log = std::string(program.getInfoLog()) + program.getInfoDebugLog();
+            return result;
         }
+
+        std::vector<unsigned int> spirv;
+        glslang::GlslangToSpv(*program.getIntermediate(language), spirv);
+
+        std::ofstream output(outputPath, std::ios::binary | std::ios::trunc);
+        output.write(reinterpret_cast<const char*>(spirv.data()),
+                     static_cast<std::streamsize>(spirv.size() * sizeof(unsigned int)));
+        if (!output) {
+            result.log = std::string("Failed to write ") + outputPath + "\n";
+            return result;
+        }
+
+        result.log = shader.getInfoLog();
+        result.success = true;
+        return result;
     }
-    
-    if (!file.is_open()) {
+
+    // Locations readFile() probes, in order
+    constexpr const char* SEARCH_PREFIXES[] = {
+        "",          // Direct path (current working directory)
+        "../",       // One level up (if running from build/)
+        "../../",    // Two levels up
+        "./"         // Explicit current directory
+    };
+
+    // Finds the file readFile() would open, probing SEARCH_PREFIXES in order.
+    // file_size() both finds the candidate and sizes the buffer in one stat: it
+    // fails for missing paths and directories, so those are skipped without an
+    // open(), and the contents then arrive in a single read with no seeks
+    bool resolveFilePath(const std::string& filename, std::string& foundPath, std::uintmax_t& fileSize) {
+        std::error_code ec;
+        // Each candidate string is built only when probed
+        for (const char* prefix : SEARCH_PREFIXES) {
+            std::string path = prefix + filename;
+            fileSize = std::filesystem::file_size(path, ec);
+            if (!ec) {
+                foundPath = std::move(path);
+                return true;
+            }
+        }
+        return false;
+    }
+
+    // A compiled shader is current when its SPIR-V output is at least as new as
+    // its GLSL source; skipping the compiler then avoids a compile per stage
+    bool isShaderUpToDate(const std::string& sourcePath, const std::string& outputPath) {
+        std::error_code ec;
+        auto sourceTime = std::filesystem::last_write_time(sourcePath, ec);
+        if (ec) {
+            return false;
+        }
+        auto outputTime = std::filesystem::last_write_time(outputPath, ec);
+        if (ec) {
+            return false;
+        }
+        return outputTime >= sourceTime;
+    }
+
+    // Content hash of each shader source at its last successful compile. Catches
+    // sources whose timestamp moved without their text changing (editor re-save,
+    // git checkout) so they don't trigger a compiler run either. The source's
+    // timestamp is kept so a re-saved source is hashed only once; the output is
+    // never touched, so the renderer's record of the loaded .spv stays valid.
+    // The output's timestamp and size are recorded too: the CMake shader rules
+    // write the same .spv files, so a matching source hash alone doesn't prove
+    // the output on disk is still the one this compile produced
+    struct CompiledShaderRecord {
+        size_t sourceHash;
+        std::filesystem::file_time_type sourceTime;
+        std::filesystem::file_time_type outputTime;
+        std::uintmax_t outputSize;
+    };
+    std::unordered_map<std::string, CompiledShaderRecord> compiledShaders;
+    std::mutex compiledShadersMutex;
+
+    bool statShaderOutput(const std::string& outputPath, std::filesystem::file_time_type& time, std::uintmax_t& size) {
+        std::error_code ec;
+        time = std::filesystem::last_write_time(outputPath, ec);
+        if (ec) {
+            return false;
+        }
+        size = std::filesystem::file_size(outputPath, ec);
+        return !ec;
+    }
+
+    bool readShaderSource(const std::string& sourcePath, std::string& contents) {
+        std::ifstream file(sourcePath, std::ios::binary);
+        if (!file.is_open()) {
+            return false;
+        }
+        contents.assign(std::istreambuf_iterator<char>(file), std::istreambuf_iterator<char>());
+        return true;
+    }
+}
+
+std::vector<char> Utils::readFile(const std::string& filename) {
+    std::string foundPath;
+    std::uintmax_t fileSize = 0;
+    if (!resolveFilePath(filename, foundPath, fileSize)) {
         std::string errorMsg = "Failed to open file: " + filename + "\nSearched paths:\n";
-        for (const auto& path : searchPaths) {
-            errorMsg += "  - " + path + "\n";
+        for (const char* prefix : SEARCH_PREFIXES) {
+            errorMsg += std::string("  - ") + prefix + filename + "\n";
         }
         throw std::runtime_error(errorMsg);
     }
 
-    size_t fileSize = (size_t) file.tellg();
-    std::vector<char> buffer(fileSize);
+    std::ifstream file(foundPath, std::ios::binary);
+    if (!file.is_open()) {
+        throw std::runtime_error("Failed to open file: " + foundPath);
+    }
 
-    file.seekg(0);
-    file.read(buffer.data(), fileSize);
-    file.close();
+    std::vector<char> buffer(static_cast<size_t>(fileSize));
+    file.read(buffer.data(), static_cast<std::streamsize>(buffer.size()));
+    if (static_cast<size_t>(file.gcount()) != buffer.size()) {
+        throw std::runtime_error("Failed to read file: " + foundPath);
+    }
 
     return buffer;
 }
 
-bool Utils::recompileShaders() {
-    std::cout << "[SHADER] Recompiling vertex shader..." << std::endl;
-    // Go up one directory from build/ to access shaders/
-    int vertResult = std::system("cd ../shaders && glslc triangle.vert -o vert.spv 2>&1");
-    if (vertResult != 0) {
-        std::cout << "[ERROR] Vertex shader compilation failed (exit code: " << vertResult << ")" << std::endl;
-        std::cout << "[HINT] Check shaders/triangle.vert for syntax errors" << std::endl;
+bool Utils::getFileStamp(const std::string& filename, FileStamp& stamp) {
+    std::string foundPath;
+    if (!resolveFilePath(filename, foundPath, stamp.size)) {
         return false;
     }
-    std::cout << "[SHADER] Vertex shader compiled successfully" << std::endl;
-    
-    std::cout << "[SHADER] Recompiling fragment shader..." << std::endl;
-    int fragResult = std::system("cd ../shaders && glslc triangle.frag -o frag.spv 2>&1");
-    if (fragResult != 0) {
-        std::cout << "[ERROR] Fragment shader compilation failed (exit code: " << fragResult << ")" << std::endl;
-        std::cout << "[HINT] Check shaders/triangle.frag for syntax errors" << std::endl;
-        return false;
+
+    std::error_code ec;
+    stamp.modified = std::filesystem::last_write_time(foundPath, ec);
+    return !ec;
+}
+
+Utils::ShaderRecompileResult Utils::recompileShaders() {
+    struct ShaderStage {
+        const char* name;
+        const char* hintName;
+        EShLanguage language;
+        const char* source;
+        const char* output;
+    };
+
+    // Paths are relative to build/, where the executable runs
+    using VulkanMon::Config::Shaders;
+    static constexpr ShaderStage stages[] = {
+        {"Vertex", "triangle.vert", EShLangVertex, Shaders::HOT_RELOAD_VERTEX_SOURCE, Shaders::HOT_RELOAD_VERTEX_OUTPUT},
+        {"Fragment", "triangle.frag", EShLangFragment, Shaders::HOT_RELOAD_FRAGMENT_SOURCE, Shaders::HOT_RELOAD_FRAGMENT_OUTPUT}
+    };
+
+    struct PendingCompile {
+        const ShaderStage* stage;
+        size_t sourceHash;
+        std::filesystem::file_time_type sourceTime;
+        std::future<StageCompileResult> result;
+    };
+
+    // Stages are independent, so stale ones compile concurrently: wall time is the slowest compile, not the sum
+    bool allSucceeded = true;
+    std::vector<PendingCompile> pending;
+    for (const auto& stage : stages) {
+        if (isShaderUpToDate(stage.source, stage.output)) {
+            std::cout << "[SHADER] " << stage.name << " shader unchanged, skipping recompile" << std::endl;
+            continue;
+        }
+
+        std::error_code ec;
+        auto sourceTime = std::filesystem::last_write_time(stage.source, ec);
+        std::filesystem::file_time_type outputTime;
+        std::uintmax_t outputSize = 0;
+        const bool haveOutput = !ec && statShaderOutput(stage.output, outputTime, outputSize);
+        if (haveOutput) {
+            std::lock_guard<std::mutex> lock(compiledShadersMutex);
+            auto previous = compiledShaders.find(stage.source);
+            if (previous != compiledShaders.end() && previous->second.sourceTime == sourceTime &&
+                previous->second.outputTime == outputTime && previous->second.outputSize == outputSize) {
+                std::cout << "[SHADER] " << stage.name << " shader content unchanged, skipping recompile" << std::endl;
+                continue;
+            }
+        }
+
+        std::string source;
+        if (!readShaderSource(stage.source, source)) {
+            std::cout << "[ERROR] Failed to open shader source: " << stage.source << std::endl;
+            allSucceeded = false;
+            continue;
+        }
+
+        size_t sourceHash = std::hash<std::string>{}(source);
+        if (haveOutput) {
+            std::lock_guard<std::mutex> lock(compiledShadersMutex);
+            auto previous = compiledShaders.find(stage.source);
+            if (previous != compiledShaders.end() && previous->second.sourceHash == sourceHash &&
+                previous->second.outputTime == outputTime && previous->second.outputSize == outputSize) {
+                // Leave the output alone; remember the new source timestamp so the
+                // next call skips without rehashing
+                previous->second.sourceTime = sourceTime;
+                std::cout << "[SHADER] " << stage.name << " shader content unchanged, skipping recompile" << std::endl;
+                continue;
+            }
+        }
+
+        std::cout << "[SHADER] Recompiling " << stage.hintName << "..." << std::endl;
+        initializeShaderCompiler();
+        pending.push_back({&stage, sourceHash, sourceTime, std::async(std::launch::async, [&stage, source = std::move(source)]() {
+            return compileShaderStage(stage.language, source, stage.source, stage.output);
+        })});
     }
-    std::cout << "[SHADER] Fragment shader compiled successfully" << std::endl;
-    
+
+    // Each stage's compiler log is printed whole, in stage order
+    for (auto& compile : pending) {
+        StageCompileResult result = compile.result.get();
+        if (!result.log.empty()) {
+            std::cout << result.log;
+            if (result.log.back() != '\n') {
+                std::cout << '\n';
+            }
+        }
+
+        if (!result.success) {
+            std::cout << "[ERROR] " << compile.stage->name << " shader compilation failed" << std::endl;
+            std::cout << "[HINT] Check shaders/" << compile.stage->hintName << " for syntax errors" << std::endl;
+            allSucceeded = false;
+        } else {
+            std::cout << "[SHADER] " << compile.stage->name << " shader compiled successfully" << std::endl;
+            std::filesystem::file_time_type compiledTime;
+            std::uintmax_t compiledSize = 0;
+            if (statShaderOutput(compile.stage->output, compiledTime, compiledSize)) {
+                std::lock_guard<std::mutex> lock(compiledShadersMutex);
+                compiledShaders[compile.stage->source] = {compile.sourceHash, compile.sourceTime, compiledTime, compiledSize};
+            }
+        }
+    }
+
+    if (!allSucceeded) {
+        return ShaderRecompileResult::Failed;
+    }
+
+    if (pending.empty()) {
+        std::cout << "[SHADER] All shaders up to date, nothing to recompile" << std::endl;
+        return ShaderRecompileResult::UpToDate;
+    }
+
     std::cout << "[SUCCESS] All shaders recompiled and ready!" << std::endl;
-    return true;
-}
\ No newline at end of file
+    return ShaderRecompileResult::Recompiled;
+}
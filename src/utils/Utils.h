@@ -2,9 +2,27 @@
 
 #include <vector>
 #include <string>
+#include <cstdint>
+#include <filesystem>
 
 class Utils {
 public:
+    enum class ShaderRecompileResult {
+        Recompiled,   // At least one stage was compiled; SPIR-V on disk changed
+        UpToDate,     // Every stage was already current; nothing was compiled
+        Failed        // A stage failed to compile
+    };
+
+    // Modification time and size of a file, for cheap "changed on disk?" checks
+    struct FileStamp {
+        std::filesystem::file_time_type modified{};
+        std::uintmax_t size = 0;
+
+        bool operator==(const FileStamp&) const = default;
+    };
+
     static std::vector<char> readFile(const std::string& filename);
-    static bool recompileShaders();
+    // Stamps the file readFile() would open for the same name; false if none is found
+    static bool getFileStamp(const std::string& filename, FileStamp& stamp);
+    static ShaderRecompileResult recompileShaders();
 };
\ No newline at end of file
@@ -1,25 +1,56 @@
 #include "TestHelpers.h"
 #include <fstream>
+#include <random>
+#include <algorithm>
 
 namespace VulkanMon {
 namespace Testing {
 
+namespace {
+    // Owns the per-process scratch directory and removes it when the test run exits
+    struct ScratchDirectory {
+        std::filesystem::path path;
+        
+        ScratchDirectory() {
+            std::random_device random;
+            auto ticks = std::chrono::steady_clock::now().time_since_epoch().count();
+            path = std::filesystem::temp_directory_path() /
+                   ("vulkanmon_tests_" + std::to_string(ticks) + "_" + std::to_string(random()));
+            std::filesystem::create_directories(path);
+        }
+        
+        ~ScratchDirectory() {
+            std::error_code ec;
+            std::filesystem::remove_all(path, ec);
+        }
+    };
+}
+
 // ============================================================================
 // FileTestHelpers Implementation (Minimal for Phase 1)
 // ============================================================================
 
+const std::filesystem::path& FileTestHelpers::tempDirectory() {
+    static ScratchDirectory scratch;
+    return scratch.path;
+}
+
+std::string FileTestHelpers::tempPath(const std::string& filename) {
+    return (tempDirectory() / filename).string();
+}
+
 std::string FileTestHelpers::createTempFile(const std::string& filename, const std::string& content) {
-    std::string tempPath = "temp_" + filename;
-    std::ofstream file(tempPath);
+    std::string tempFilePath = tempPath("temp_" + filename);
+    std::ofstream file(tempFilePath);
     if (file.is_open()) {
         file << content;
         file.close();
     }
-    return tempPath;
+    return tempFilePath;
 }
 
 std::string FileTestHelpers::createTempDirectory(const std::string& dirName) {
-    std::string tempDir = "temp_" + dirName;
+    std::string tempDir = tempPath("temp_" + dirName);
     std::filesystem::create_directory(tempDir);
     return tempDir;
 }
@@ -48,57 +79,79 @@ std::string FileTestHelpers::createTestModel(const std::string& filename) {
 }
 
 bool FileTestHelpers::validateFile(const std::string& path, size_t expectedMinSize) {
-    if (!std::filesystem::exists(path)) {
-        return false;
-    }
-    
-    auto fileSize = std::filesystem::file_size(path);
-    return fileSize >= expectedMinSize;
+    // One stat: file_size fails (rather than throws) for missing paths and directories
+    std::error_code ec;
+    auto fileSize = std::filesystem::file_size(path, ec);
+    return !ec && fileSize >= expectedMinSize;
 }
 
 // ============================================================================
 // StringTestHelpers Implementation (Minimal for Phase 1)
 // ============================================================================
 
-bool StringTestHelpers::containsAll(const std::string& text, const std::vector<std::string>& substrings) {
+bool StringTestHelpers::containsAll(std::string_view text, const std::vector<std::string>& substrings) {
+    return findMissing(text, substrings).empty();
+}
+
+std::vector<std::string> StringTestHelpers::findMissing(std::string_view text, const std::vector<std::string>& substrings) {
+    std::vector<std::string> missing;
     for (const auto& substring : substrings) {
-        if (text.find(substring) == std::string::npos) {
-            return false;
+        if (text.find(substring) == std::string_view::npos) {
+            missing.push_back(substring);
+        }
+    }
+    return missing;
+}
+
+std::vector<std::string> StringTestHelpers::findMissingInLines(const std::vector<std::string>& lines,
+                                                              const std::vector<std::string>& substrings) {
+    std::vector<std::string> pending(substrings);
+    for (const auto& line : lines) {
+        if (pending.empty()) {
+            break;
         }
+        pending.erase(std::remove_if(pending.begin(), pending.end(), [&line](const std::string& needle) {
+            return line.find(needle) != std::string::npos;
+        }), pending.end());
     }
-    return true;
+    return pending;
 }
 
-bool StringTestHelpers::isValidLogFormat(const std::string& logLine) {
+bool StringTestHelpers::isValidLogFormat(std::string_view logLine) {
     // Simple validation - look for timestamp and log level
-    return logLine.find("[") != std::string::npos && logLine.find("]") != std::string::npos;
+    return logLine.find("[") != std::string_view::npos && logLine.find("]") != std::string_view::npos;
 }
 
-std::string StringTestHelpers::extractLogLevel(const std::string& logLine) {
+std::string StringTestHelpers::extractLogLevel(std::string_view logLine) {
     size_t start = logLine.find("[");
     size_t end = logLine.find("]", start);
-    if (start != std::string::npos && end != std::string::npos) {
-        return logLine.substr(start + 1, end - start - 1);
+    if (start != std::string_view::npos && end != std::string_view::npos) {
+        return std::string(logLine.substr(start + 1, end - start - 1));
     }
     return "";
 }
 
-size_t StringTestHelpers::countOccurrences(const std::string& text, const std::string& substring) {
+size_t StringTestHelpers::countOccurrences(std::string_view text, std::string_view substring) {
     size_t count = 0;
     size_t pos = 0;
-    while ((pos = text.find(substring, pos)) != std::string::npos) {
+    while ((pos = text.find(substring, pos)) != std::string_view::npos) {
         count++;
         pos += substring.length();
     }
     return count;
 }
 
-std::vector<std::string> StringTestHelpers::split(const std::string& text, char delimiter) {
+std::vector<std::string> StringTestHelpers::split(std::string_view text, char delimiter) {
+    // Same results as std::getline splitting: a trailing delimiter adds no empty item
     std::vector<std::string> result;
-    std::stringstream ss(text);
-    std::string item;
-    while (std::getline(ss, item, delimiter)) {
-        result.push_back(item);
+    size_t start = 0;
+    while (start < text.size()) {
+        size_t end = text.find(delimiter, start);
+        if (end == std::string_view::npos) {
+            end = text.size();
+        }
+        result.emplace_back(text.substr(start, end - start));
+        start = end + 1;
     }
     return result;
 }
@@ -1,6 +1,7 @@
 #pragma once
 
 #include <string>
+#include <string_view>
 #include <vector>
 #include <filesystem>
 #include <fstream>
@@ -9,6 +10,8 @@
 #include <functional>
 #include <memory>
 
+#include "../../src/utils/Logger.h"
+
 /**
  * VulkanMon Test Helpers
  * 
@@ -18,6 +21,7 @@
  * - File system helpers for asset testing
  * - Timing utilities for performance testing
  * - String manipulation for log testing
+ * - Log capture for asserting on Logger output
  * - Thread testing utilities
  */
 
@@ -29,6 +33,14 @@ namespace Testing {
  */
 class FileTestHelpers {
 public:
+    // Per-process scratch directory under the system temp dir, created on first use
+    // and removed at exit; keeps parallel test processes (ctest -j) from colliding
+    // on shared file names in the working directory
+    static const std::filesystem::path& tempDirectory();
+    
+    // Path of a scratch file inside tempDirectory()
+    static std::string tempPath(const std::string& filename);
+    
     // Create a temporary test file with specified content
     static std::string createTempFile(const std::string& filename, const std::string& content);
     
@@ -118,20 +130,64 @@ public:
  */
 class StringTestHelpers {
 public:
+    // All helpers take std::string_view so raw buffers (e.g. Utils::readFile's
+    // std::vector<char>) can be searched in place without copying into a std::string
+    
     // Check if string contains all specified substrings
-    static bool containsAll(const std::string& text, const std::vector<std::string>& substrings);
+    static bool containsAll(std::string_view text, const std::vector<std::string>& substrings);
+    
+    // Return the substrings that are NOT present (empty when all are found)
+    // Use with CAPTURE() so a failing check reports every missing needle at once
+    static std::vector<std::string> findMissing(std::string_view text, const std::vector<std::string>& substrings);
+    
+    // Line-oriented findMissing() for captured log output: each line is only tested
+    // against needles still pending, and the scan stops once every needle has matched
+    static std::vector<std::string> findMissingInLines(const std::vector<std::string>& lines,
+                                                      const std::vector<std::string>& substrings);
     
     // Check if string matches expected log format
-    static bool isValidLogFormat(const std::string& logLine);
+    static bool isValidLogFormat(std::string_view logLine);
     
     // Extract log level from log line
-    static std::string extractLogLevel(const std::string& logLine);
+    static std::string extractLogLevel(std::string_view logLine);
     
     // Count occurrences of substring
-    static size_t countOccurrences(const std::string& text, const std::string& substring);
+    static size_t countOccurrences(std::string_view text, std::string_view substring);
     
     // Split string by delimiter
-    static std::vector<std::string> split(const std::string& text, char delimiter);
+    static std::vector<std::string> split(std::string_view text, char delimiter);
+    
+    // View a byte buffer as text without copying
+    static std::string_view asText(const std::vector<char>& buffer) {
+        return std::string_view(buffer.data(), buffer.size());
+    }
+};
+
+/**
+ * Log Capture Helper
+ * RAII wrapper around Logger::startCapture()/stopCapture() so a failing
+ * REQUIRE still ends the capture for the next test
+ */
+class LogCapture {
+public:
+    LogCapture() { Logger::getInstance().startCapture(); }
+    ~LogCapture() {
+        if (!stopped_) {
+            Logger::getInstance().stopCapture();
+        }
+    }
+    
+    LogCapture(const LogCapture&) = delete;
+    LogCapture& operator=(const LogCapture&) = delete;
+    
+    // End the capture and return every formatted line logged since construction
+    std::vector<std::string> stop() {
+        stopped_ = true;
+        return Logger::getInstance().stopCapture();
+    }
+    
+private:
+    bool stopped_ = false;
 };
 
 /**
@@ -14,9 +14,31 @@
 
 #include <catch2/catch_test_macros.hpp>
 #include <catch2/catch_session.hpp>
+#include <catch2/reporters/catch_reporter_event_listener.hpp>
+#include <catch2/reporters/catch_reporter_registrars.hpp>
+#include <GLFW/glfw3.h>
 
 // Note: Using Catch2::Catch2WithMain means we don't need to define main()
 // Catch2 will automatically generate it for us
 
-// Any global test setup can be done here using Catch2 listeners
-// For now, we rely on the default Catch2 behavior
\ No newline at end of file
+// Global test setup is done here using Catch2 listeners
+
+/**
+ * Keeps GLFW alive for the whole test run
+ *
+ * Catch2 re-runs a TEST_CASE body for every SECTION, so fixtures that paired
+ * glfwInit()/glfwTerminate() paid full GLFW startup and shutdown per section.
+ * Fixtures now only call glfwInit() (a no-op once initialized) and GLFW is
+ * terminated a single time when the run ends. glfwTerminate() is safe to call
+ * even if no test initialized GLFW.
+ */
+class GLFWSessionListener : public Catch::EventListenerBase {
+public:
+    using Catch::EventListenerBase::EventListenerBase;
+
+    void testRunEnded(Catch::TestRunStats const&) override {
+        glfwTerminate();
+    }
+};
+
+CATCH_REGISTER_LISTENER(GLFWSessionListener)
\ No newline at end of file
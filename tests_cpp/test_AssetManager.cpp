@@ -272,8 +272,8 @@ TEST_CASE("Asset Path Management", "[AssetManager][Paths]") {
 TEST_CASE("AssetManager File System Helpers", "[AssetManager][FileSystem]") {
     SECTION("File existence validation") {
         // Test file existence checking logic with temporary files
-        std::string existingFile = "test_existing_file.tmp";
-        std::string nonExistentFile = "test_non_existent_file.tmp";
+        std::string existingFile = FileTestHelpers::tempPath("test_existing_file.tmp");
+        std::string nonExistentFile = FileTestHelpers::tempPath("test_non_existent_file.tmp");
         
         // Create a temporary file for testing
         std::ofstream tempFile(existingFile);
@@ -284,9 +284,6 @@ TEST_CASE("AssetManager File System Helpers", "[AssetManager][FileSystem]") {
         // Test file existence
         REQUIRE(std::filesystem::exists(existingFile));
         REQUIRE_FALSE(std::filesystem::exists(nonExistentFile));
-        
-        // Cleanup
-        std::remove(existingFile.c_str());
     }
     
     SECTION("Directory structure validation") {
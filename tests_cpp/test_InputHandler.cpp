@@ -47,6 +47,7 @@ public:
 };
 
 // Test fixture for GLFW initialization (needed for key constants)
+// GLFW is terminated once at the end of the test run by the listener in main.cpp
 class InputTestFixture {
 public:
     InputTestFixture() {
@@ -55,10 +56,6 @@ public:
         }
     }
 
-    ~InputTestFixture() {
-        glfwTerminate();
-    }
-
     // Simple helper to create InputHandler with minimal ECS setup
     std::unique_ptr<VulkanMon::InputHandler> createInputHandler() {
         // Create minimal ECS world
@@ -36,8 +36,34 @@ TEST_CASE("Logger Basic Functionality", "[Logger][Basic]") {
         // Set to WARNING level
         logger.setLogLevel(LogLevel::WARNING_LEVEL);
         
-        // These will be implemented with actual output capture in Phase 2
-        REQUIRE(true); // Placeholder - will test actual output capture
+        LogCapture capture;
+        logger.info("Filtered info message");
+        logger.warning("Visible warning message");
+        auto lines = capture.stop();
+        
+        // Restore default level before asserting so other tests are unaffected
+        logger.setLogLevel(LogLevel::INFO_LEVEL);
+        
+        REQUIRE(lines.size() == 1);
+        REQUIRE(lines[0].find("[WARN ] Visible warning message") != std::string::npos);
+    }
+    
+    SECTION("Captured output contains every expected message") {
+        auto& logger = Logger::getInstance();
+        
+        LogCapture capture;
+        logger.info("Descriptor set created successfully!");
+        logger.warning("Swap chain out of date");
+        logger.error("Pipeline creation failed");
+        auto lines = capture.stop();
+        
+        auto missing = StringTestHelpers::findMissingInLines(lines, {
+            "[INFO ] Descriptor set created successfully!",
+            "[WARN ] Swap chain out of date",
+            "[ERROR] Pipeline creation failed"
+        });
+        CAPTURE(missing);
+        REQUIRE(missing.empty());
     }
 }
 
@@ -57,15 +83,12 @@ TEST_CASE("Logger Thread Safety", "[Logger][Threading]") {
 TEST_CASE("Logger File Output", "[Logger][File]") {
     SECTION("Enable and disable file output") {
         auto& logger = Logger::getInstance();
-        std::string tempFile = "test_log_output.txt";
+        std::string tempFile = FileTestHelpers::tempPath("test_log_output.txt");
         
         logger.enableFileOutput(tempFile);
         logger.info("Test message to file");
         logger.disableFileOutput();
         
-        // Clean up
-        std::filesystem::remove(tempFile);
-        
         REQUIRE(true); // Will implement file content validation in Phase 2
     }
 }
@@ -83,6 +106,12 @@ TEST_CASE("Logger Performance Macros", "[Logger][Performance]") {
 TEST_CASE("Logger Vulkan Integration", "[Logger][Vulkan]") {
     SECTION("Vulkan-specific logging helpers") {
         REQUIRE_NOTHROW(VKMON_VK_INFO("Test Operation", "Additional details"));
+        
+        LogCapture capture;
         REQUIRE_NOTHROW(VKMON_VK_ERROR("Test Operation", "Test error message"));
+        auto lines = capture.stop();
+        
+        REQUIRE(lines.size() == 1);
+        REQUIRE(lines[0].find("[VULKAN ERROR] Test Operation - Test error message") != std::string::npos);
     }
 }
\ No newline at end of file
@@ -24,6 +24,29 @@
 using namespace VulkanMon;
 using Catch::Approx;
 
+/**
+ * Shared setup for ProjectileSystem tests: a World with one camera entity and a
+ * ProjectileSystem without MaterialSystem. Construct one per SECTION.
+ */
+struct ProjectileTestScene {
+    World world;
+    EntityManager& entityManager;
+    std::unique_ptr<CameraSystem> cameraSystem;
+    std::unique_ptr<ProjectileSystem> projectileSystem;
+
+    explicit ProjectileTestScene(const glm::vec3& cameraPosition = glm::vec3(0.0f))
+        : entityManager(world.getEntityManager())
+        , cameraSystem(std::make_unique<CameraSystem>()) {
+        EntityID cameraEntity = entityManager.createEntity();
+        Transform cameraTransform;
+        cameraTransform.position = cameraPosition;
+        entityManager.addComponent(cameraEntity, cameraTransform);
+        entityManager.addComponent(cameraEntity, Camera{});
+
+        projectileSystem = std::make_unique<ProjectileSystem>(cameraSystem.get(), nullptr);
+    }
+};
+
 TEST_CASE("ProjectileComponent Factory Methods", "[Projectile][Component]") {
     SECTION("createBullet factory") {
         auto bullet = ProjectileComponent::createBullet(100.0f);
@@ -210,22 +233,9 @@ TEST_CASE("ProjectileComponent Physics", "[Projectile][Component]") {
 
 TEST_CASE("ProjectileSystem Spawning", "[Projectile][System]") {
     SECTION("spawnProjectile creates entity with components") {
-        World world;
-        auto& entityManager = world.getEntityManager();
-
-        // Create minimal camera for CameraSystem
-        auto cameraSystem = std::make_unique<CameraSystem>();
-        EntityID cameraEntity = entityManager.createEntity();
-        Transform cameraTransform;
-        cameraTransform.position = glm::vec3(0.0f, 5.0f, 10.0f);
-        entityManager.addComponent(cameraEntity, cameraTransform);
-
-        Camera camera;
-        camera.aspectRatio = 16.0f / 9.0f;
-        entityManager.addComponent(cameraEntity, camera);
-
-        // Create ProjectileSystem (without MaterialSystem for unit test)
-        auto projectileSystem = std::make_unique<ProjectileSystem>(cameraSystem.get(), nullptr);
+        ProjectileTestScene scene(glm::vec3(0.0f, 5.0f, 10.0f));
+        auto& entityManager = scene.entityManager;
+        auto& projectileSystem = scene.projectileSystem;
 
         glm::vec3 spawnPos(0.0f, 1.0f, 0.0f);
         glm::vec3 direction(0.0f, 0.0f, -1.0f);
@@ -242,20 +252,9 @@ TEST_CASE("ProjectileSystem Spawning", "[Projectile][System]") {
     }
 
     SECTION("spawned projectile has correct Transform") {
-        World world;
-        auto& entityManager = world.getEntityManager();
-
-        auto cameraSystem = std::make_unique<CameraSystem>();
-        EntityID cameraEntity = entityManager.createEntity();
-        Transform cameraTransform;
-        cameraTransform.position = glm::vec3(0.0f, 5.0f, 10.0f);
-        entityManager.addComponent(cameraEntity, cameraTransform);
-
-        Camera camera;
-        camera.aspectRatio = 16.0f / 9.0f;
-        entityManager.addComponent(cameraEntity, camera);
-
-        auto projectileSystem = std::make_unique<ProjectileSystem>(cameraSystem.get(), nullptr);
+        ProjectileTestScene scene(glm::vec3(0.0f, 5.0f, 10.0f));
+        auto& entityManager = scene.entityManager;
+        auto& projectileSystem = scene.projectileSystem;
 
         glm::vec3 spawnPos(5.0f, 10.0f, -3.0f);
         glm::vec3 direction(0.0f, -1.0f, 0.0f);
@@ -272,17 +271,9 @@ TEST_CASE("ProjectileSystem Spawning", "[Projectile][System]") {
     }
 
     SECTION("spawned projectile has correct SpatialComponent") {
-        World world;
-        auto& entityManager = world.getEntityManager();
-
-        auto cameraSystem = std::make_unique<CameraSystem>();
-        EntityID cameraEntity = entityManager.createEntity();
-        Transform cameraTransform;
-        entityManager.addComponent(cameraEntity, cameraTransform);
-        Camera camera;
-        entityManager.addComponent(cameraEntity, camera);
-
-        auto projectileSystem = std::make_unique<ProjectileSystem>(cameraSystem.get(), nullptr);
+        ProjectileTestScene scene;
+        auto& entityManager = scene.entityManager;
+        auto& projectileSystem = scene.projectileSystem;
 
         EntityID projectileEntity = projectileSystem->spawnProjectile(
             glm::vec3(0.0f), glm::vec3(0.0f, 0.0f, -1.0f), entityManager,
@@ -297,17 +288,9 @@ TEST_CASE("ProjectileSystem Spawning", "[Projectile][System]") {
 
 TEST_CASE("ProjectileSystem Update and Cleanup", "[Projectile][System]") {
     SECTION("update processes active projectiles") {
-        World world;
-        auto& entityManager = world.getEntityManager();
-
-        auto cameraSystem = std::make_unique<CameraSystem>();
-        EntityID cameraEntity = entityManager.createEntity();
-        Transform cameraTransform;
-        entityManager.addComponent(cameraEntity, cameraTransform);
-        Camera camera;
-        entityManager.addComponent(cameraEntity, camera);
-
-        auto projectileSystem = std::make_unique<ProjectileSystem>(cameraSystem.get(), nullptr);
+        ProjectileTestScene scene;
+        auto& entityManager = scene.entityManager;
+        auto& projectileSystem = scene.projectileSystem;
 
         EntityID projectile = projectileSystem->spawnProjectile(
             glm::vec3(0.0f, 10.0f, 0.0f),
@@ -325,17 +308,9 @@ TEST_CASE("ProjectileSystem Update and Cleanup", "[Projectile][System]") {
     }
 
     SECTION("update destroys expired projectiles") {
-        World world;
-        auto& entityManager = world.getEntityManager();
-
-        auto cameraSystem = std::make_unique<CameraSystem>();
-        EntityID cameraEntity = entityManager.createEntity();
-        Transform cameraTransform;
-        entityManager.addComponent(cameraEntity, cameraTransform);
-        Camera camera;
-        entityManager.addComponent(cameraEntity, camera);
-
-        auto projectileSystem = std::make_unique<ProjectileSystem>(cameraSystem.get(), nullptr);
+        ProjectileTestScene scene;
+        auto& entityManager = scene.entityManager;
+        auto& projectileSystem = scene.projectileSystem;
 
         // Create bullet with very short lifetime
         EntityID projectile = projectileSystem->spawnProjectile(
@@ -357,17 +332,9 @@ TEST_CASE("ProjectileSystem Update and Cleanup", "[Projectile][System]") {
     }
 
     SECTION("getProjectileCount returns correct count") {
-        World world;
-        auto& entityManager = world.getEntityManager();
-
-        auto cameraSystem = std::make_unique<CameraSystem>();
-        EntityID cameraEntity = entityManager.createEntity();
-        Transform cameraTransform;
-        entityManager.addComponent(cameraEntity, cameraTransform);
-        Camera camera;
-        entityManager.addComponent(cameraEntity, camera);
-
-        auto projectileSystem = std::make_unique<ProjectileSystem>(cameraSystem.get(), nullptr);
+        ProjectileTestScene scene;
+        auto& entityManager = scene.entityManager;
+        auto& projectileSystem = scene.projectileSystem;
 
         REQUIRE(projectileSystem->getProjectileCount(entityManager) == 0);
 
@@ -381,17 +348,9 @@ TEST_CASE("ProjectileSystem Update and Cleanup", "[Projectile][System]") {
     }
 
     SECTION("destroyAllProjectiles clears all projectiles") {
-        World world;
-        auto& entityManager = world.getEntityManager();
-
-        auto cameraSystem = std::make_unique<CameraSystem>();
-        EntityID cameraEntity = entityManager.createEntity();
-        Transform cameraTransform;
-        entityManager.addComponent(cameraEntity, cameraTransform);
-        Camera camera;
-        entityManager.addComponent(cameraEntity, camera);
-
-        auto projectileSystem = std::make_unique<ProjectileSystem>(cameraSystem.get(), nullptr);
+        ProjectileTestScene scene;
+        auto& entityManager = scene.entityManager;
+        auto& projectileSystem = scene.projectileSystem;
 
         // Spawn 5 projectiles above ground
         for (int i = 0; i < 5; ++i) {
@@ -412,17 +371,9 @@ TEST_CASE("ProjectileSystem Update and Cleanup", "[Projectile][System]") {
 
 TEST_CASE("ProjectileSystem Performance", "[Projectile][System][Performance]") {
     SECTION("performance stats track update time") {
-        World world;
-        auto& entityManager = world.getEntityManager();
-
-        auto cameraSystem = std::make_unique<CameraSystem>();
-        EntityID cameraEntity = entityManager.createEntity();
-        Transform cameraTransform;
-        entityManager.addComponent(cameraEntity, cameraTransform);
-        Camera camera;
-        entityManager.addComponent(cameraEntity, camera);
-
-        auto projectileSystem = std::make_unique<ProjectileSystem>(cameraSystem.get(), nullptr);
+        ProjectileTestScene scene;
+        auto& entityManager = scene.entityManager;
+        auto& projectileSystem = scene.projectileSystem;
 
         // Spawn 10 projectiles above ground
         for (int i = 0; i < 10; ++i) {
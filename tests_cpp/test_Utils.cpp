@@ -16,8 +16,10 @@
 #include "../src/utils/Utils.h"
 #include "fixtures/TestHelpers.h"
 #include <fstream>
-#include <cstdio>
+#include <filesystem>
+#include <chrono>
 #include <iostream>
+#include <type_traits>
 
 using namespace VulkanMon::Testing;
 using Catch::Approx;
@@ -25,7 +27,7 @@ using Catch::Approx;
 TEST_CASE("Utils File Operations", "[Utils][File]") {
     SECTION("File reading with valid content") {
         // Create a test file with known content (avoid newlines for cross-platform compatibility)
-        std::string testFilename = "test_file_content.txt";
+        std::string testFilename = FileTestHelpers::tempPath("test_file_content.txt");
         std::string testContent = "Hello, VulkanMon Unit Test! This is test file content.";
         
         // Write test file
@@ -38,17 +40,13 @@ TEST_CASE("Utils File Operations", "[Utils][File]") {
         std::vector<char> readContent = Utils::readFile(testFilename);
         
         // Verify content matches exactly (single line, no line ending issues)
-        std::string readString(readContent.begin(), readContent.end());
-        REQUIRE(readString == testContent);
+        REQUIRE(StringTestHelpers::asText(readContent) == testContent);
         REQUIRE(readContent.size() == testContent.length());
-        
-        // Cleanup
-        std::remove(testFilename.c_str());
     }
     
     SECTION("File reading with binary content") {
         // Create a test file with binary content
-        std::string testFilename = "test_binary.bin";
+        std::string testFilename = FileTestHelpers::tempPath("test_binary.bin");
         std::vector<unsigned char> binaryData = {0x00, 0x01, 0xFF, 0xAA, 0x55, 0xEF, 0xBE, 0xAD, 0xDE};
         
         // Write binary test file
@@ -62,17 +60,12 @@ TEST_CASE("Utils File Operations", "[Utils][File]") {
         
         // Verify binary content matches
         REQUIRE(readContent.size() == binaryData.size());
-        for (size_t i = 0; i < binaryData.size(); ++i) {
-            REQUIRE(static_cast<unsigned char>(readContent[i]) == binaryData[i]);
-        }
-        
-        // Cleanup
-        std::remove(testFilename.c_str());
+        REQUIRE(readContent == std::vector<char>(binaryData.begin(), binaryData.end()));
     }
     
     SECTION("File reading with empty file") {
         // Create an empty test file
-        std::string testFilename = "test_empty.txt";
+        std::string testFilename = FileTestHelpers::tempPath("test_empty.txt");
         std::ofstream testFile(testFilename);
         REQUIRE(testFile.is_open());
         testFile.close();
@@ -83,9 +76,6 @@ TEST_CASE("Utils File Operations", "[Utils][File]") {
         // Verify empty content
         REQUIRE(readContent.empty());
         REQUIRE(readContent.size() == 0);
-        
-        // Cleanup
-        std::remove(testFilename.c_str());
     }
     
     SECTION("File reading error conditions") {
@@ -125,15 +115,38 @@ TEST_CASE("Utils File Operations", "[Utils][File]") {
         REQUIRE(readContent1.size() == readContent2.size());
         REQUIRE(readContent1 == readContent2);
         
-        // Cleanup
-        std::remove(testFilename.c_str());
+        // Cleanup (this file lives in the working directory, not the scratch directory)
+        std::error_code ec;
+        std::filesystem::remove(testFilename, ec);
+    }
+    
+    SECTION("File stamp tracks changes to the file readFile opens") {
+        std::string testFilename = FileTestHelpers::tempPath("test_stamp.spv");
+        std::ofstream(testFilename, std::ios::binary) << "spirv";
+        
+        Utils::FileStamp loaded;
+        REQUIRE(Utils::getFileStamp(testFilename, loaded));
+        REQUIRE(loaded.size == 5);
+        
+        // Unchanged on disk, the stamp matches
+        Utils::FileStamp current;
+        REQUIRE(Utils::getFileStamp(testFilename, current));
+        REQUIRE(current == loaded);
+        
+        // Rewritten (as a CMake shader rebuild would), the stamp differs
+        std::ofstream(testFilename, std::ios::binary | std::ios::trunc) << "rebuilt spirv";
+        REQUIRE(Utils::getFileStamp(testFilename, current));
+        REQUIRE(current != loaded);
+        
+        std::filesystem::remove(testFilename);
+        REQUIRE_FALSE(Utils::getFileStamp(testFilename, current));
     }
 }
 
 TEST_CASE("Utils String Operations", "[Utils][String]") {
     SECTION("File content as string conversion") {
         // Test converting file content to string format
-        std::string testFilename = "test_string_conversion.txt";
+        std::string testFilename = FileTestHelpers::tempPath("test_string_conversion.txt");
         std::string testContent = "String conversion test with various words and content";
         
         // Write test file
@@ -149,18 +162,17 @@ TEST_CASE("Utils String Operations", "[Utils][String]") {
         // Verify string conversion
         REQUIRE(convertedString == testContent);
         REQUIRE(convertedString.find("String conversion test") == 0);
-        REQUIRE(convertedString.find("various words") != std::string::npos);
-        REQUIRE(convertedString.find("content") != std::string::npos);
         
-        // Cleanup
-        std::remove(testFilename.c_str());
+        auto missing = StringTestHelpers::findMissing(convertedString, {"various words", "content"});
+        CAPTURE(missing);
+        REQUIRE(missing.empty());
     }
 }
 
 TEST_CASE("Utils File Size Handling", "[Utils][FileSize]") {
     SECTION("Large file reading") {
         // Test reading larger files (1KB test file)
-        std::string testFilename = "test_large_file.txt";
+        std::string testFilename = FileTestHelpers::tempPath("test_large_file.txt");
         std::string largeContent;
         
         // Generate 1KB of content (single line to avoid line ending issues)
@@ -176,21 +188,22 @@ TEST_CASE("Utils File Size Handling", "[Utils][FileSize]") {
         
         // Test Utils::readFile with larger content
         std::vector<char> readContent = Utils::readFile(testFilename);
-        std::string readString(readContent.begin(), readContent.end());
+        std::string_view readText = StringTestHelpers::asText(readContent);
         
         // Verify large content matches (test key properties rather than exact match)
-        REQUIRE(readString.length() == largeContent.length());
-        REQUIRE(readString.find("This is segment 0 of test content") != std::string::npos);
-        REQUIRE(readString.find("This is segment 99 of test content") != std::string::npos);
+        REQUIRE(readText.length() == largeContent.length());
+        auto missing = StringTestHelpers::findMissing(readText, {
+            "This is segment 0 of test content",
+            "This is segment 99 of test content"
+        });
+        CAPTURE(missing);
+        REQUIRE(missing.empty());
         REQUIRE(readContent.size() > 1000); // Should be over 1KB
-        
-        // Cleanup
-        std::remove(testFilename.c_str());
     }
     
     SECTION("File size calculation accuracy") {
         // Test that file size calculation is accurate
-        std::string testFilename = "test_size_accuracy.txt";
+        std::string testFilename = FileTestHelpers::tempPath("test_size_accuracy.txt");
         std::vector<std::string> testContents = {
             "",                          // 0 bytes
             "A",                        // 1 byte
@@ -215,36 +228,74 @@ TEST_CASE("Utils File Size Handling", "[Utils][FileSize]") {
             }
             
             // Verify content accuracy
-            std::string readString(readContent.begin(), readContent.end());
-            auto trimString = [](std::string& s) {
-                s.erase(s.find_last_not_of(" \t\n\r\f\v") + 1);
+            // Trim trailing whitespace on views; no copies of either buffer are needed
+            auto trimString = [](std::string_view s) {
+                size_t end = s.find_last_not_of(" \t\n\r\f\v");
+                return end == std::string_view::npos ? std::string_view() : s.substr(0, end + 1);
             };
-            std::string trimmedRead = readString;
-            std::string trimmedExpected = content;
-            trimString(trimmedRead);
-            trimString(trimmedExpected);
-            REQUIRE(trimmedRead == trimmedExpected);
+            REQUIRE(trimString(StringTestHelpers::asText(readContent)) == trimString(content));
         }
-        
-        // Cleanup
-        std::remove(testFilename.c_str());
     }
 }
 
 TEST_CASE("Utils Shader Operations", "[Utils][Shader]") {
     SECTION("Shader recompilation interface") {
-        // Test that recompileShaders function exists and returns boolean
-        // Note: We don't actually run shader compilation in unit tests
-        // as it requires external tools and shader files
-        
-        // This test validates the interface exists and is callable
-        // Actual shader compilation testing should be in integration tests
-        REQUIRE(true); // Interface validation - function exists
+        // Test that recompileShaders function exists and reports a ShaderRecompileResult
+        STATIC_REQUIRE(std::is_same_v<decltype(Utils::recompileShaders()), Utils::ShaderRecompileResult>);
+    }
+    
+    SECTION("Shader recompilation skips unchanged shaders") {
+        // recompileShaders() uses paths relative to build/, so lay out a scratch
+        // project (build/ next to shaders/) and run from its build directory
+        struct CurrentPathGuard {
+            std::filesystem::path previous = std::filesystem::current_path();
+            ~CurrentPathGuard() {
+                std::error_code ec;
+                std::filesystem::current_path(previous, ec);
+            }
+        } guard;
+        
+        std::filesystem::path projectDir = FileTestHelpers::createTempDirectory("shader_reload");
+        std::filesystem::create_directory(projectDir / "build");
+        std::filesystem::create_directory(projectDir / "shaders");
+        
+        const std::string fragSource =
+            "#version 450\n"
+            "layout(location = 0) out vec4 outColor;\n"
+            "void main() { outColor = vec4(1.0); }\n";
+        std::ofstream(projectDir / "shaders" / "triangle.vert") << "#version 450\nvoid main() { gl_Position = vec4(0.0); }\n";
+        std::ofstream(projectDir / "shaders" / "triangle.frag") << fragSource;
+        
+        std::filesystem::current_path(projectDir / "build");
+        
+        // Missing outputs are compiled, after which both stages are current
+        REQUIRE(Utils::recompileShaders() == Utils::ShaderRecompileResult::Recompiled);
+        REQUIRE(Utils::recompileShaders() == Utils::ShaderRecompileResult::UpToDate);
+        
+        Utils::FileStamp loaded;
+        REQUIRE(Utils::getFileStamp("shaders/frag.spv", loaded));
+        
+        // Re-saving identical source text moves its timestamp past the output but
+        // compiles nothing and leaves the output untouched
+        std::filesystem::path fragPath = projectDir / "shaders" / "triangle.frag";
+        std::ofstream(fragPath, std::ios::trunc) << fragSource;
+        std::filesystem::last_write_time(fragPath, loaded.modified + std::chrono::seconds(5));
+        REQUIRE(Utils::recompileShaders() == Utils::ShaderRecompileResult::UpToDate);
+        REQUIRE(Utils::recompileShaders() == Utils::ShaderRecompileResult::UpToDate);
+        
+        Utils::FileStamp current;
+        REQUIRE(Utils::getFileStamp("shaders/frag.spv", current));
+        REQUIRE(current == loaded);
+        
+        // A .spv rewritten outside recompileShaders() (e.g. by a CMake build) is detected
+        std::ofstream(projectDir / "shaders" / "frag.spv", std::ios::binary | std::ios::trunc) << "rebuilt";
+        REQUIRE(Utils::getFileStamp("shaders/frag.spv", current));
+        REQUIRE(current != loaded);
     }
     
     SECTION("Shader file reading simulation") {
         // Test reading shader-like files (SPIR-V binary format simulation)
-        std::string testFilename = "test_shader.spv";
+        std::string testFilename = FileTestHelpers::tempPath("test_shader.spv");
         
         // Create a mock SPIR-V file with magic number and some binary data
         std::vector<unsigned char> spirvData = {
@@ -267,16 +318,8 @@ TEST_CASE("Utils Shader Operations", "[Utils][Shader]") {
         // Verify shader file content
         REQUIRE(readContent.size() == spirvData.size());
         
-        // Check SPIR-V magic number
-        if (readContent.size() >= 4) {
-            REQUIRE(static_cast<unsigned char>(readContent[0]) == 0x03);
-            REQUIRE(static_cast<unsigned char>(readContent[1]) == 0x02);
-            REQUIRE(static_cast<unsigned char>(readContent[2]) == 0x23);
-            REQUIRE(static_cast<unsigned char>(readContent[3]) == 0x07);
-        }
-        
-        // Cleanup
-        std::remove(testFilename.c_str());
+        // Check the whole header (magic number included) in one comparison
+        REQUIRE(readContent == std::vector<char>(spirvData.begin(), spirvData.end()));
     }
 }
 
@@ -296,6 +339,19 @@ TEST_CASE("Utils Error Handling", "[Utils][ErrorHandling]") {
         REQUIRE_THROWS_AS(Utils::readFile(longPath), std::runtime_error);
     }
     
+    SECTION("Reading a directory throws runtime_error") {
+        // A directory named like a shader must fail with a readable error,
+        // not a bogus size or allocation failure
+        std::string directory = FileTestHelpers::createTempDirectory("not_a_shader.spv");
+        
+        try {
+            Utils::readFile(directory);
+            REQUIRE(false); // Should not reach here
+        } catch (const std::runtime_error& e) {
+            REQUIRE(std::string_view(e.what()).find("Failed to open file") != std::string_view::npos);
+        }
+    }
+    
     SECTION("Error message quality") {
         // Test that error messages are informative
         std::string testFilename = "definitely_nonexistent_file_12345.xyz";
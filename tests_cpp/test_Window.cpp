@@ -23,6 +23,8 @@ using namespace VulkanMon::Testing;
 using Catch::Approx;
 
 // Test fixture for GLFW initialization
+// GLFW stays initialized for the whole test run (terminated by the listener in
+// main.cpp), so repeated glfwInit() calls from every SECTION are cheap no-ops
 class WindowTestFixture {
 public:
     WindowTestFixture() {
@@ -30,10 +32,6 @@ public:
             throw std::runtime_error("Failed to initialize GLFW for testing");
         }
     }
-    
-    ~WindowTestFixture() {
-        glfwTerminate();
-    }
 };
 
 // REMOVED: Basic Construction test - pointless constructor testing